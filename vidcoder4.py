@@ -1,43 +1,101 @@
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
-import ffmpeg
 import os
 import re
+import json
+import functools
 from typing import List
 from dataclasses import dataclass
 import subprocess
 import threading
-import time
+from concurrent.futures import ThreadPoolExecutor
 from queue import Queue
+from collections import deque
 
+FFMPEG_MISSING_MESSAGE = (
+    "FFmpeg is required but not found on your system.\n\n"
+    "Please install FFmpeg:\n"
+    "1. Download from https://www.gyan.dev/ffmpeg/builds/ffmpeg-release-essentials.zip\n"
+    "2. Extract the zip file\n"
+    "3. Copy all .exe files from the bin folder to C:\\Windows\\System32\n"
+    "4. Restart this application"
+)
+
+@functools.lru_cache(maxsize=1)
 def check_ffmpeg():
     try:
         subprocess.run(['ffmpeg', '-version'], capture_output=True, check=True)
         return True
     except (subprocess.SubprocessError, FileNotFoundError):
-        messagebox.showerror(
-            "FFmpeg Not Found",
-            "FFmpeg is required but not found on your system.\n\n"
-            "Please install FFmpeg:\n"
-            "1. Download from https://www.gyan.dev/ffmpeg/builds/ffmpeg-release-essentials.zip\n"
-            "2. Extract the zip file\n"
-            "3. Copy all .exe files from the bin folder to C:\\Windows\\System32\n"
-            "4. Restart this application"
-        )
         return False
 
+@functools.lru_cache(maxsize=1)
 def check_nvidia_gpu():
     try:
-        # Check if NVIDIA GPU is available through ffmpeg
-        result = subprocess.run(['ffmpeg', '-encoders'], capture_output=True, text=True)
-        return 'h264_nvenc' in result.stdout
-    except:
+        # Ask the driver for an actual GPU instead of listing ffmpeg's encoders
+        result = subprocess.run(['nvidia-smi', '-L'], capture_output=True, timeout=5, check=True)
+        return result.stdout.strip().startswith(b'GPU 0:')
+    except (subprocess.SubprocessError, OSError):
+        return False
+
+def ffmpeg_lists(option, *names):
+    """Return whether ffmpeg's -encoders/-filters listing includes all of names"""
+    try:
+        result = subprocess.run(['ffmpeg', '-hide_banner', option], capture_output=True, timeout=10, check=True,
+                                encoding='utf-8', errors='replace')
+    except (subprocess.SubprocessError, OSError):
         return False
+    listed = {fields[1] for fields in (line.split() for line in result.stdout.splitlines()) if len(fields) > 1}
+    return all(name in listed for name in names)
+
+@functools.lru_cache(maxsize=1)
+def check_ffmpeg_nvenc():
+    # Many Linux and conda builds of ffmpeg ship without NVENC
+    return ffmpeg_lists('-encoders', 'h264_nvenc')
+
+@functools.lru_cache(maxsize=1)
+def check_ffmpeg_cuda_filters():
+    return ffmpeg_lists('-filters', 'scale_cuda', 'overlay_cuda')
+
+def probe(path: str) -> dict:
+    """Return ffprobe's stream information for path"""
+    result = subprocess.run(
+        ['ffprobe', '-v', 'error', '-print_format', 'json', '-show_streams', path],
+        capture_output=True, encoding='utf-8', errors='replace'  # ffprobe writes UTF-8 JSON
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"Could not read {path}:\n{result.stderr}")
+    return json.loads(result.stdout)
+
+# Frame timestamp in a showinfo log line
+SHOWINFO_PTS_PATTERN = re.compile(r'pts_time:(\d+(?:\.\d+)?)')
+
+# CPU times in the -benchmark summary line
+BENCHMARK_PATTERN = re.compile(r'bench: utime=(\d+(?:\.\d+)?)s stime=(\d+(?:\.\d+)?)s rtime=(\d+(?:\.\d+)?)s')
+
+# Concurrent NVENC sessions allowed on consumer NVIDIA GPUs
+NVENC_MAX_SESSIONS = 3
+
+# Segments per ffmpeg run on the CPU path. Every libx264 encoder stays alive until
+# ffmpeg exits, and long command lines hit the Windows 32,767 character limit.
+CPU_MAX_SEGMENTS = 8
+
+# NVENC presets from fastest (p1) to best quality (p7)
+NVENC_PRESETS = ('p1', 'p2', 'p3', 'p4', 'p5', 'p6', 'p7')
+
+# Input codecs sent to ffmpeg's *_cuvid decoders. VP9 and AV1 need newer GPUs
+# (Pascal and Ampere), so they stay on the CPU decode path.
+CUVID_CODECS = ('h264', 'hevc')
+
+# One MM:SS-MM:SS range, capturing minutes and seconds of both ends
+TIMESTAMP_PATTERN = re.compile(r'^(\d{1,2}):([0-5]\d)-(\d{1,2}):([0-5]\d)\s*$')
 
 @dataclass
 class TimeSegment:
-    start: str  # Format: "MM:SS"
-    end: str    # Format: "MM:SS"
+    start: str      # Format: "MM:SS"
+    end: str        # Format: "MM:SS"
+    start_s: float  # Start in seconds
+    end_s: float    # End in seconds
 
 class VideoProcessor:
     def __init__(self):
@@ -48,25 +106,207 @@ class VideoProcessor:
         self.processing_thread = None
         self.progress_queue = Queue()
         self.status_queue = Queue()
-        self.has_nvidia = check_nvidia_gpu()
+        self.progress_callback = None
+        self.has_nvidia = check_nvidia_gpu() and check_ffmpeg_nvenc()
+        self.has_cuda_filters = self.has_nvidia and check_ffmpeg_cuda_filters()
+        self.nvenc_preset = 'p1'
         
-    def convert_timestamp(self, timestamp: str) -> float:
-        """Convert MM:SS format to seconds"""
-        parts = timestamp.split(':')
-        if len(parts) != 2:
-            raise ValueError(f"Invalid timestamp format: {timestamp}. Use MM:SS format.")
-        try:
-            minutes = int(parts[0])
-            seconds = int(parts[1])
-            if seconds >= 60:
-                raise ValueError(f"Seconds must be less than 60 in timestamp: {timestamp}")
-            return minutes * 60 + seconds
-        except ValueError as e:
-            raise ValueError(f"Invalid timestamp format: {timestamp}. Use MM:SS format with numbers only.") from e
+    def report(self, progress=None, status=None):
+        """Queue a progress value and/or status message, then notify the listener"""
+        if progress is not None:
+            self.progress_queue.put(progress)
+        if status is not None:
+            self.status_queue.put(status)
+        if self.progress_callback:
+            self.progress_callback()
+    
+    def read_progress(self, stream, log_lines, offset: float, total: float):
+        """Turn showinfo frame timestamps on stream into overall percentages, keeping other lines in log_lines"""
+        reported = int(offset / total * 100)
+        for line in stream:
+            if not line.startswith('[Parsed_showinfo'):
+                log_lines.append(line)
+                continue
+            match = SHOWINFO_PTS_PATTERN.search(line)
+            if match:
+                # Only notify on whole-percent steps, and never move backwards
+                progress = min(100, int((offset + float(match.group(1))) / total * 100))
+                if progress > reported:
+                    reported = progress
+                    self.report(progress=progress)
+    
+    def build_command(self, batch, videos, segment_width: int, segment_height: int, copy_audio: bool):
+        """Build one ffmpeg command writing every segment in batch, returning it with the decoded span length"""
+        span_start = min(segment.start_s for segment in batch)
+        span_duration = max(segment.end_s for segment in batch) - span_start
+        
+        # Build the ffmpeg command with hardware acceleration if available
+        video_encoder = 'h264_nvenc' if self.has_nvidia else 'libx264'
+        encoder_preset = self.nvenc_preset if self.has_nvidia else 'ultrafast'
+        
+        # Centered crop offsets for each input, as plain integers so ffmpeg
+        # has no expressions to evaluate
+        crop_offsets = [((width - segment_width) // 2, (height - segment_height) // 2) for width, height, _ in videos]
+        
+        # Decode and crop on the GPU when NVDEC can handle both inputs and ffmpeg can stack
+        # CUDA frames
+        gpu_decode = self.has_cuda_filters and all(codec in CUVID_CODECS for _, _, codec in videos)
+        
+        # Input seek skips everything before the first segment without decoding it,
+        # and -t stops reading after the last one
+        input_seek = ['-ss', str(span_start), '-t', str(span_duration)]
+        
+        # Base command for video
+        command = [
+            'ffmpeg',
+            '-y',
+            '-nostats',
+            '-benchmark'  # Report CPU time used when done
+        ]
+        
+        if gpu_decode:
+            for path, (width, height, codec), (crop_x, crop_y) in zip(
+                (self.top_video, self.bottom_video), videos, crop_offsets
+            ):
+                # NVDEC crops while decoding (top x bottom x left x right), so only the
+                # cropped frame ever exists in VRAM
+                command.extend([
+                    '-hwaccel', 'cuda',
+                    '-hwaccel_output_format', 'cuda',  # Keep decoded frames in VRAM
+                    '-c:v', f'{codec}_cuvid',
+                    '-crop', f'{crop_y}x{height - segment_height - crop_y}x{crop_x}x{width - segment_width - crop_x}',
+                    *input_seek, '-i', path.replace('\\', '/')
+                ])
+        else:
+            # No -hwaccel here: 'auto' would probe every hardware API at startup
+            # only to hand frames back to the CPU filters
+            command.extend([
+                *input_seek, '-i', self.top_video.replace('\\', '/'),
+                *input_seek, '-i', self.bottom_video.replace('\\', '/')
+            ])
+        
+        # Add audio input if specified
+        if self.audio_file:
+            command.extend([*input_seek, '-i', self.audio_file.replace('\\', '/')])
+        
+        # Merge overlapping segments into the time ranges that actually get written
+        # (batch is sorted by start, times relative to span_start)
+        ranges = []
+        for segment in batch:
+            start, end = segment.start_s - span_start, segment.end_s - span_start
+            if ranges and start <= ranges[-1][1]:
+                ranges[-1][1] = max(ranges[-1][1], end)
+            else:
+                ranges.append([start, end])
+        
+        # showinfo logs every decoded top frame's timestamp to stderr, which run_ffmpeg turns
+        # into progress across the whole span. ffmpeg's own -progress out_time follows a
+        # single segment output, so it stalls and jumps back with several outputs.
+        frame_log = 'showinfo=checksum=0'
+        
+        # With gaps between segments, drop the frames no segment uses before any
+        # crop or stack work is done on them
+        if len(ranges) > 1:
+            selected = '+'.join(f'between(t,{start},{end})' for start, end in ranges)
+            filter_complex = f"[0:v]{frame_log},select='{selected}'[top_in];[1:v]select='{selected}'[bottom_in];"
+            bottom_in = '[bottom_in]'
+        else:
+            filter_complex = f'[0:v]{frame_log}[top_in];'
+            bottom_in = '[1:v]'
+        top_in = '[top_in]'
+        
+        # Stack once, then split the stacked video into one branch per segment
+        split_outputs = ''.join(f'[v{i}]' for i in range(len(batch)))
+        if gpu_decode:
+            # vstack only runs on system memory, so stack in VRAM instead: stretch a copy of
+            # the already cropped top half to full height as a canvas and overlay both halves
+            # onto it. NVENC then encodes the CUDA frames directly.
+            filter_complex += (
+                f'{top_in}split[top][top_copy];'
+                f'[top_copy]scale_cuda={segment_width}:{segment_height * 2}[canvas];'
+                '[canvas][top]overlay_cuda=x=0:y=0[upper];'
+                f'[upper]{bottom_in}overlay_cuda=x=0:y={segment_height},split={len(batch)}{split_outputs}'
+            )
+        else:
+            (top_x, top_y), (bottom_x, bottom_y) = crop_offsets
+            filter_complex += (
+                f'{top_in}crop={segment_width}:{segment_height}:{top_x}:{top_y}[top];'
+                f'{bottom_in}crop={segment_width}:{segment_height}:{bottom_x}:{bottom_y}[bottom];'
+                f'[top][bottom]vstack,split={len(batch)}{split_outputs}'
+            )
+        command.extend(['-filter_complex', filter_complex])
+        
+        # Use external audio if provided, otherwise top video audio
+        audio_map = '2:a' if self.audio_file else '0:a'
+        
+        # Audio that is already AAC is copied as is instead of being re-encoded
+        audio_codec = ['-c:a', 'copy'] if copy_audio else ['-c:a', 'aac']
+        
+        # Segments are the final deliverables, so NVENC uses high-quality tuning at a
+        # fixed 15M CBR with lookahead and AQ left at their defaults; let libx264 use
+        # every core, with sliced threads so each frame is split across them
+        if self.has_nvidia:
+            encoder_tuning = [
+                '-tune', 'hq',
+                '-rc', 'cbr',
+                '-b:v', '15M',
+                '-maxrate', '15M',
+                '-bufsize', '30M'
+            ]
+        else:
+            encoder_tuning = [
+                '-threads', '0',
+                '-x264opts', 'threads=auto:sliced-threads=1:lookahead-threads=2'
+            ]
+        
+        # Add one output per segment, all fed from the same decode and filtergraph
+        for i, segment in enumerate(batch):
+            output_file = os.path.join(
+                self.output_dir, 
+                f'segment_{segment.start.replace(":", ".")}-{segment.end.replace(":", ".")}.mp4'
+            ).replace('\\', '/')
+            
+            command.extend([
+                '-map', f'[v{i}]',
+                '-map', audio_map,
+                '-ss', str(segment.start_s - span_start),  # Inputs start at span_start
+                '-t', str(segment.end_s - segment.start_s),
+                '-c:v', video_encoder,
+                '-preset', encoder_preset,
+                *encoder_tuning,
+                *audio_codec,
+                output_file
+            ])
+        
+        return command, span_duration
+    
+    def run_ffmpeg(self, command: List[str], progress_offset: float, progress_total: float):
+        process = subprocess.Popen(
+            command, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE,
+            bufsize=1 << 20, encoding='utf-8', errors='replace'  # ffmpeg logs UTF-8 paths and tags
+        )
+        
+        # stderr is the only pipe, so reading it to the end for progress keeps ffmpeg from
+        # ever stalling on it; only the last log lines are kept for error reports
+        stderr_lines = deque(maxlen=50)
+        self.read_progress(process.stderr, stderr_lines, progress_offset, progress_total)
+        process.wait()
+        
+        if process.returncode != 0:
+            raise RuntimeError(f"FFmpeg Error:\n{''.join(stderr_lines)}")
+        
+        # Return the user/system/real seconds -benchmark reported
+        for line in stderr_lines:
+            match = BENCHMARK_PATTERN.search(line)
+            if match:
+                return [float(value) for value in match.groups()]
+        return [0.0, 0.0, 0.0]
     
     def process_videos(self, segments: List[TimeSegment], progress_callback=None):
+        self.progress_callback = progress_callback
+        
         if not check_ffmpeg():
-            return
+            raise RuntimeError(FFMPEG_MISSING_MESSAGE)
 
         if not all([self.top_video, self.bottom_video, self.output_dir]):
             raise ValueError("Missing input files or output directory")
@@ -79,155 +319,74 @@ class VideoProcessor:
         if self.audio_file and not self.audio_file.lower().endswith(('.mp3', '.wav', '.m4a', '.aac')):
             raise ValueError("Audio file must be mp3, wav, m4a, or aac format")
             
-        self.status_queue.put("Analyzing videos...")
+        self.report(status="Analyzing videos...")
         
-        # Get video dimensions for both videos
-        probe_top = ffmpeg.probe(self.top_video)
-        probe_bottom = ffmpeg.probe(self.bottom_video)
+        # Get video dimensions and codecs for both videos, probing them concurrently
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            probe_top, probe_bottom = executor.map(probe, [self.top_video, self.bottom_video])
         width_top = int(probe_top['streams'][0]['width'])
         height_top = int(probe_top['streams'][0]['height'])
         width_bottom = int(probe_bottom['streams'][0]['width'])
         height_bottom = int(probe_bottom['streams'][0]['height'])
+        videos = [
+            (width_top, height_top, probe_top['streams'][0]['codec_name']),
+            (width_bottom, height_bottom, probe_bottom['streams'][0]['codec_name'])
+        ]
+        
+        # Top video audio can be copied into the segments when it is already AAC
+        top_audio_codecs = [stream['codec_name'] for stream in probe_top['streams'] if stream['codec_type'] == 'audio']
+        copy_audio = not self.audio_file and set(top_audio_codecs) == {'aac'}
         
         # Calculate dimensions for 9:16 final output
         target_height = min(height_top, height_bottom)
         segment_height = target_height // 2
         segment_width = int(segment_height * 9 / 8)
         
-        # Create combined video
-        temp_output = os.path.join(self.output_dir, "temp_combined.mp4").replace('\\', '/')
+        # 4:2:0 frames (and NV12 surfaces on the GPU path) need even dimensions
+        segment_height -= segment_height % 2
+        segment_width -= segment_width % 2
+        
+        # Validate segment durations
+        for segment in segments:
+            if segment.end_s - segment.start_s <= 0:
+                raise ValueError(f"Invalid segment duration: {segment.start}-{segment.end}")
+        
+        # Every segment output holds its own encoder for the whole run, so split the work
+        # into batches that stay under the NVENC session limit, or a bounded number of
+        # libx264 encoders on the CPU path. Sorting keeps each batch's span, and so its
+        # decode, as short as possible. Output names come from the range alone, so a
+        # repeated range is only encoded once.
+        unique = {(segment.start_s, segment.end_s): segment for segment in reversed(segments)}
+        ordered = sorted(unique.values(), key=lambda segment: segment.start_s)
+        batch_size = NVENC_MAX_SESSIONS if self.has_nvidia else CPU_MAX_SEGMENTS
+        batches = [ordered[i:i + batch_size] for i in range(0, len(ordered), batch_size)]
         
         try:
-            self.status_queue.put("Combining videos...")
-
-            # Build the ffmpeg command with hardware acceleration if available
-            video_encoder = 'h264_nvenc' if self.has_nvidia else 'libx264'
-            encoder_preset = 'p1' if self.has_nvidia else 'ultrafast'
-            
-            # Base command for video
-            command = [
-                'ffmpeg',
-                '-hwaccel', 'auto',  # Enable hardware acceleration
-                '-i', self.top_video.replace('\\', '/'),
-                '-i', self.bottom_video.replace('\\', '/')
-            ]
-            
-            # Add audio input if specified
-            if self.audio_file:
-                command.extend(['-i', self.audio_file.replace('\\', '/')])
-            
-            # Add video filter complex
-            command.extend([
-                '-filter_complex',
-                f'[0:v]crop={segment_width}:{segment_height}:(in_w-{segment_width})/2:(in_h-{segment_height})/2[top];'
-                f'[1:v]crop={segment_width}:{segment_height}:(in_w-{segment_width})/2:(in_h-{segment_height})/2[bottom];'
-                '[top][bottom]vstack[v]'
-            ])
-            
-            # Add mapping
-            command.extend(['-map', '[v]'])
-            
-            # Add audio mapping based on presence of audio file
-            if self.audio_file:
-                command.extend(['-map', '2:a'])  # Use external audio
-            else:
-                command.extend(['-map', '0:a'])  # Use top video audio
-            
-            # Add encoding parameters
-            command.extend([
-                '-c:v', video_encoder,
-                '-preset', encoder_preset,
-                '-c:a', 'aac',  # Use AAC audio codec
-                '-y',
-                temp_output
-            ])
-            
-            # Start the process
-            process = subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-            
-            # Monitor progress during combining phase
-            start_time = time.time()
-            progress = 0
-            while process.poll() is None and progress < 98:
-                time.sleep(0.1)  # Small delay for smooth progress
-                progress += 0.1  # Increment by 0.1%
-                self.progress_queue.put(progress)
-            
-            # Wait for process to complete
-            stdout, stderr = process.communicate()
+            commands = [self.build_command(batch, videos, segment_width, segment_height, copy_audio) for batch in batches]
+            total_duration = sum(span_duration for _, span_duration in commands)
             
-            if process.returncode != 0:
-                raise RuntimeError(f"FFmpeg Error:\n{stderr.decode()}")
-            
-            self.progress_queue.put(30)  # Progress after combination
+            progress_offset = 0
+            cpu_times = [0.0, 0.0, 0.0]  # user, system, real seconds
+            for index, (command, span_duration) in enumerate(commands, 1):
+                if len(commands) > 1:
+                    self.report(status=f"Processing segments (batch {index}/{len(commands)})...")
+                else:
+                    self.report(status="Processing segments...")
+                
+                batch_times = self.run_ffmpeg(command, progress_offset, total_duration)
+                cpu_times = [total + value for total, value in zip(cpu_times, batch_times)]
+                progress_offset += span_duration
             
-            # Process segments sequentially
-            def process_segment(segment, index, total):
-                try:
-                    self.status_queue.put(f"Processing segment {index}/{total}...")
-                    
-                    start_seconds = self.convert_timestamp(segment.start)
-                    end_seconds = self.convert_timestamp(segment.end)
-                    duration = end_seconds - start_seconds
-                    
-                    if duration <= 0:
-                        raise ValueError(f"Invalid segment duration: {segment.start}-{segment.end}")
-                    
-                    output_file = os.path.join(
-                        self.output_dir, 
-                        f'segment_{segment.start.replace(":", ".")}-{segment.end.replace(":", ".")}.mp4'
-                    ).replace('\\', '/')
-                    
-                    # Enhanced segment extraction with proper encoding settings
-                    segment_command = [
-                        'ffmpeg',
-                        '-hwaccel', 'auto',
-                        '-ss', str(start_seconds),
-                        '-i', temp_output,
-                        '-t', str(duration),
-                        '-c:v', video_encoder,
-                        '-preset', encoder_preset,
-                        '-c:a', 'aac',
-                        '-avoid_negative_ts', '1',
-                        '-async', '1',
-                        '-vsync', 'cfr',  # Use constant frame rate
-                        '-max_muxing_queue_size', '1024',  # Increase muxing queue size
-                        '-y',
-                        output_file
-                    ]
-                    
-                    process = subprocess.run(segment_command, capture_output=True, text=True)
-                    if process.returncode != 0:
-                        raise RuntimeError(f"FFmpeg Error during segmentation:\n{process.stderr}")
-                    
-                    # Simulate gradual progress for this segment
-                    progress_start = 30 + ((index - 1) / total * 70)
-                    progress_end = 30 + (index / total * 70)
-                    progress_step = (progress_end - progress_start) / 10
-                    
-                    for i in range(10):
-                        time.sleep(0.1)  # Small delay for smoother progress
-                        self.progress_queue.put(progress_start + (i * progress_step))
-                    
-                    self.progress_queue.put(progress_end)
-                        
-                except Exception as e:
-                    raise RuntimeError(f"Error processing segment {segment.start}-{segment.end}: {str(e)}")
+            self.report(progress=100)
             
-            # Process segments sequentially to avoid timing issues
-            total_segments = len(segments)
-            for i, segment in enumerate(segments, 1):
-                process_segment(segment, i, total_segments)
+            # Summarize core utilization for the user
+            user_time, system_time, real_time = cpu_times
+            cores_busy = (user_time + system_time) / real_time if real_time else 0
+            return (f"CPU time: {user_time:.1f}s user + {system_time:.1f}s system "
+                    f"in {real_time:.1f}s ({cores_busy:.1f} cores busy on average)")
                     
         except Exception as e:
             raise RuntimeError(f"Video processing failed: {str(e)}")
-        finally:
-            # Clean up temporary file
-            try:
-                if os.path.exists(temp_output):
-                    os.remove(temp_output)
-            except Exception as e:
-                print(f"Warning: Could not remove temporary file {temp_output}: {str(e)}")
 
 class Application(tk.Tk):
     def __init__(self):
@@ -251,9 +410,18 @@ class Application(tk.Tk):
         button_bg = '#007acc'
         
         # GPU status
-        gpu_status = "NVIDIA GPU Acceleration Available" if self.processor.has_nvidia else "CPU Mode (No NVIDIA GPU)"
+        gpu_status = "NVIDIA GPU Acceleration Available" if self.processor.has_nvidia else "CPU Mode (No NVIDIA GPU or NVENC)"
         tk.Label(self, text=gpu_status, bg=bg_color, fg='#00ff00' if self.processor.has_nvidia else '#ff9900').pack(pady=5)
         
+        # NVENC preset selection
+        if self.processor.has_nvidia:
+            tk.Label(self, text="NVENC Preset (p1 fastest, p7 best quality):", bg=bg_color, fg=fg_color).pack(pady=5)
+            self.preset_var = tk.StringVar(value=self.processor.nvenc_preset)
+            ttk.Combobox(
+                self, textvariable=self.preset_var,
+                values=NVENC_PRESETS, state='readonly', width=5
+            ).pack()
+        
         # File selection
         tk.Label(self, text="Top Video:", bg=bg_color, fg=fg_color).pack(pady=5)
         self.top_video_btn = tk.Button(
@@ -353,25 +521,22 @@ class Application(tk.Tk):
             
     def parse_timestamps(self) -> List[TimeSegment]:
         timestamps = []
-        pattern = re.compile(r'(\d{2}:\d{2})-(\d{2}:\d{2})')
         
         for line in self.timestamps_text.get("1.0", tk.END).split('\n'):
             line = line.strip()
             if not line:
                 continue
                 
-            match = pattern.match(line)
+            match = TIMESTAMP_PATTERN.match(line)
             if not match:
                 raise ValueError(f"Invalid timestamp format: {line}\nUse MM:SS-MM:SS format (e.g., 00:30-01:00)")
                 
-            start = match.group(1)
-            end = match.group(2)
-            
-            # Validate timestamps
-            self.processor.convert_timestamp(start)
-            self.processor.convert_timestamp(end)
-            
-            timestamps.append(TimeSegment(start, end))
+            start_m, start_sec, end_m, end_sec = match.groups()
+            timestamps.append(TimeSegment(
+                f"{start_m}:{start_sec}", f"{end_m}:{end_sec}",
+                float(int(start_m) * 60 + int(start_sec)),
+                float(int(end_m) * 60 + int(end_sec))
+            ))
             
         if not timestamps:
             raise ValueError("No timestamps provided")
@@ -382,7 +547,7 @@ class Application(tk.Tk):
         self.progress['value'] = value
         self.update_idletasks()
         
-    def check_queues(self):
+    def check_queues(self, event=None):
         # Check progress queue
         while not self.processor.progress_queue.empty():
             progress = self.processor.progress_queue.get()
@@ -393,29 +558,40 @@ class Application(tk.Tk):
             status = self.processor.status_queue.get()
             self.status_label.config(text=status)
             
-        self.after(100, self.check_queues)
+    def notify_progress(self):
+        # Called from the processing thread; Tk runs check_queues on its own event loop
+        self.event_generate('<<Progress>>', when='tail')
+        
+    def finish_processing(self, status: str, show_result):
+        # Stop listening and apply anything still queued before the final status
+        self.unbind('<<Progress>>')
+        self.check_queues()
+        self.status_label.config(text=status)
+        show_result()
+        self.process_btn.config(state=tk.NORMAL)
         
     def process_videos(self):
         try:
             timestamps = self.parse_timestamps()
+            if self.processor.has_nvidia:
+                self.processor.nvenc_preset = self.preset_var.get()
             self.process_btn.config(state=tk.DISABLED)
             self.progress['value'] = 0
             self.status_label.config(text="Starting...")
             
-            # Start queue checker
-            self.check_queues()
+            # Update the UI whenever the processor reports progress
+            self.bind('<<Progress>>', self.check_queues)
             
             # Start processing in a separate thread
             def process_thread():
                 try:
-                    self.processor.process_videos(timestamps, self.update_progress)
-                    self.after(0, lambda: self.status_label.config(text="Complete!"))
-                    self.after(0, lambda: messagebox.showinfo("Success", "Video processing complete!"))
+                    summary = self.processor.process_videos(timestamps, self.notify_progress)
+                    self.after(0, self.finish_processing, "Complete!",
+                               lambda: messagebox.showinfo("Success", f"Video processing complete!\n\n{summary}"))
                 except Exception as e:
-                    self.after(0, lambda: self.status_label.config(text="Error!"))
-                    self.after(0, lambda: messagebox.showerror("Error", str(e)))
-                finally:
-                    self.after(0, lambda: self.process_btn.config(state=tk.NORMAL))
+                    message = str(e)
+                    self.after(0, self.finish_processing, "Error!",
+                               lambda: messagebox.showerror("Error", message))
             
             threading.Thread(target=process_thread, daemon=True).start()
             
@@ -430,3 +606,5 @@ if __name__ == "__main__":
     # Check for ffmpeg before showing the window
     if check_ffmpeg():
         app.mainloop()
+    else:
+        messagebox.showerror("FFmpeg Not Found", FFMPEG_MISSING_MESSAGE)